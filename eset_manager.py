@@ -6,20 +6,33 @@ This script manages ESET endpoints via JSON-RPC API:
 - Read PC names from CSV
 - Fetch status (connectivity, AV version, definition date, Windows version, last boot)
 - Execute tasks (install/uninstall AV, run commands)
-- Dry-run mode
+- Run batches of info/task jobs from a manifest in one session
+- Profiling (cProfile/tracemalloc) and memory-budget mode for large runs
+- Adaptive (AIMD) request concurrency with a circuit breaker
+- Dry-run mode with execution plan (RPC counts, bytes, estimated duration)
 - Cross-platform (Linux/Windows)
 """
 
 import argparse
+import contextlib
+import cProfile
 import csv
+import gc
+import io
 import json
 import logging
 import os
+import pstats
 import sys
+import tempfile
+import threading
 import time
+import tracemalloc
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urljoin
 
 try:
@@ -55,10 +68,33 @@ API_NS = "Era.Common.NetworkMessage.ConsoleApi"
 API_SESSION = f"{API_NS}.SessionManagement"
 API_GROUPS = f"{API_NS}.Groups"
 API_TASKS = f"{API_NS}.TasksTriggers"
+ALL_COMPUTERS_GROUP_UUID = "00000000-0000-0000-0000-000000000000"
 
 DEFAULT_TIMEOUT = 30
 DEFAULT_RETRIES = 3
 DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_MAX_WORKERS = 4
+PROFILE_TOP_N = 15
+DEFAULT_MAX_CONCURRENCY = 4
+LATENCY_TOLERANCE = 2.0       # latency above baseline * tolerance counts as congestion
+LATENCY_SLACK = 0.2           # ...but only if also this many seconds above baseline
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_COOLDOWN = 30.0
+BREAKER_MAX_COOLDOWN = 300.0
+DEFAULT_LATENCY_ESTIMATE = 0.5  # seconds per RPC when no measurement exists
+STATS_SMOOTHING = 0.2           # EWMA weight of the newest measurement
+
+# Methods executed even in dry-run (read-only, needed to resolve names)
+DRY_RUN_ALLOWED_METHODS = {
+    f"{API_SESSION}.RpcAuthLoginRequest",
+    f"{API_GROUPS}.RpcExportComputersRequest",
+}
+# Methods issued concurrently (one per computer) during info lookups
+PARALLEL_METHODS = {
+    f"{API_GROUPS}.RpcGetComputerRequest",
+}
+MEMORY_CHECK_INTERVAL = 50  # rows between RSS checks in memory-budget mode
 
 
 # ============================================================================
@@ -76,6 +112,28 @@ def get_config_path() -> Path:
     return config_dir / "config.json"
 
 
+def get_stats_path(config_file: Optional[Path] = None) -> Path:
+    """Get measured RPC statistics file path (next to the config file in use)."""
+    return (config_file or get_config_path()).parent / "rpc_stats.json"
+
+
+def write_json_atomic(path: Path, data: Any, indent: Optional[int] = None):
+    """Write JSON via a temp file + os.replace so readers never see a partial file."""
+    tmp_name = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False,
+        ) as f:
+            tmp_name = f.name
+            json.dump(data, f, indent=indent)
+        os.replace(tmp_name, path)
+        tmp_name = None
+    finally:
+        if tmp_name is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+
+
 def load_config(config_file: Optional[Path] = None) -> Dict[str, Any]:
     """Load configuration from file or environment variables."""
     config = {
@@ -88,6 +146,7 @@ def load_config(config_file: Optional[Path] = None) -> Dict[str, Any]:
         "use_http": os.getenv("ESET_USE_HTTP", "false").lower() in ("true", "1", "yes"),
         "timeout": int(os.getenv("ESET_TIMEOUT", str(DEFAULT_TIMEOUT))),
         "retries": int(os.getenv("ESET_RETRIES", str(DEFAULT_RETRIES))),
+        "max_concurrency": int(os.getenv("ESET_MAX_CONCURRENCY", str(DEFAULT_MAX_CONCURRENCY))),
     }
 
     # Load from file if exists
@@ -102,7 +161,7 @@ def load_config(config_file: Optional[Path] = None) -> Dict[str, Any]:
                 for key in ["host", "username", "password", "domain"]:
                     if file_config.get(key):
                         config[key] = file_config[key]
-                for key in ["port", "verify_ssl", "use_http", "timeout", "retries"]:
+                for key in ["port", "verify_ssl", "use_http", "timeout", "retries", "max_concurrency"]:
                     if key in file_config:
                         config[key] = file_config[key]
         except Exception as e:
@@ -117,6 +176,393 @@ def load_config(config_file: Optional[Path] = None) -> Dict[str, Any]:
     return config
 
 
+# ============================================================================
+# Load Control
+# ============================================================================
+
+class AdaptiveConcurrencyController:
+    """
+    AIMD limit on in-flight RPCs with a circuit breaker.
+
+    - Success at normal latency: limit grows by 1/limit (about +1 per round trip)
+    - Error (5xx/429 after retries, timeout, connection error) or latency well
+      above the baseline observed for the same RPC method: limit is halved
+      (at most once per round trip)
+    - BREAKER_FAILURE_THRESHOLD consecutive errors open the circuit: callers wait
+      for the cooldown, then a single probe request decides whether to close it
+      again or reopen with a doubled cooldown.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(
+        self,
+        max_limit: int = DEFAULT_MAX_CONCURRENCY,
+        min_limit: int = 1,
+        initial_limit: int = 1,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        cooldown: float = BREAKER_COOLDOWN,
+    ):
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.limit = float(max(self.min_limit, min(initial_limit, self.max_limit)))
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = cooldown
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self.in_flight = 0
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self._cond = threading.Condition()
+        # Per-method baselines: methods differ widely (login vs. export vs. task creation)
+        self._baselines: Dict[str, float] = {}
+        self._last_decrease = 0.0
+        self._consecutive_failures = 0
+        self._open_until = 0.0
+
+    def acquire(self) -> float:
+        """Block until a request slot is available. Returns the start time for release()."""
+        with self._cond:
+            while True:
+                if self.state == self.OPEN:
+                    remaining = self._open_until - time.monotonic()
+                    if remaining > 0:
+                        self._cond.wait(remaining)
+                        continue
+                    self.state = self.HALF_OPEN
+                    self.logger.info("Circuit half-open, sending probe request")
+
+                capacity = 1 if self.state == self.HALF_OPEN else int(self.limit)
+                if self.in_flight < capacity:
+                    self.in_flight += 1
+                    return time.monotonic()
+                self._cond.wait()
+
+    def release(self, method: str, started: float, success: Optional[bool]):
+        """
+        Record the outcome of a request started by acquire().
+
+        success=None means the outcome says nothing about server load
+        (e.g. a 4xx client error) and only frees the slot.
+        """
+        now = time.monotonic()
+        latency = now - started
+
+        with self._cond:
+            self.in_flight -= 1
+            if success is True:
+                self._on_success(method, latency, now)
+            elif success is False:
+                self._on_failure(method, now)
+            self._cond.notify_all()
+
+    def _on_success(self, method: str, latency: float, now: float):
+        self._consecutive_failures = 0
+        if self.state == self.HALF_OPEN:
+            self.state = self.CLOSED
+            self.cooldown = self.base_cooldown
+            self.logger.info("Circuit closed, server recovered")
+
+        # Baseline follows the fastest observed latency of this method, drifting up slowly
+        baseline = self._baselines.get(method)
+        if baseline is None or latency < baseline:
+            baseline = latency
+        else:
+            baseline += (latency - baseline) * 0.01
+        self._baselines[method] = baseline
+
+        threshold = max(baseline * LATENCY_TOLERANCE, baseline + LATENCY_SLACK)
+        if latency > threshold:
+            self._decrease(now, baseline, f"{method.rsplit('.', 1)[-1]} latency {latency:.2f}s > {threshold:.2f}s")
+        elif self.limit < self.max_limit:
+            self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+
+    def _on_failure(self, method: str, now: float):
+        self._consecutive_failures += 1
+        self._decrease(now, self._baselines.get(method, 0.0), "request failed")
+
+        if self.state == self.HALF_OPEN:
+            self.cooldown = min(self.cooldown * 2, BREAKER_MAX_COOLDOWN)
+            self._open(now)
+        elif self.state == self.CLOSED and self._consecutive_failures >= self.failure_threshold:
+            self._open(now)
+
+    def _open(self, now: float):
+        self.state = self.OPEN
+        self._open_until = now + self.cooldown
+        self.logger.warning(
+            f"Circuit open after {self._consecutive_failures} consecutive failures, "
+            f"pausing requests for {self.cooldown:g}s"
+        )
+
+    def _decrease(self, now: float, baseline: float, reason: str):
+        # One decrease per round trip: in-flight requests report the same congestion
+        window = max(baseline, 1.0)
+        if now - self._last_decrease < window:
+            return
+        self._last_decrease = now
+        self.limit = max(float(self.min_limit), self.limit / 2)
+        self.logger.debug(f"Concurrency limit decreased to {int(self.limit)} ({reason})")
+
+
+# ============================================================================
+# Dry-Run Planning
+# ============================================================================
+
+def _short_method(method: str) -> str:
+    """Strip the API namespace from a method name for display."""
+    return method.rsplit(".", 1)[-1]
+
+
+class RpcStats:
+    """
+    Measured per-method latency and payload sizes, persisted between runs.
+
+    Every real RPC updates an exponentially weighted average, so dry-run
+    estimates follow the server's recent behavior.
+    """
+
+    def __init__(self, stats_file: Optional[Path] = None):
+        self.stats_file = stats_file
+        self.methods: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    FIELDS = ("count", "latency", "request_bytes", "response_bytes")
+
+    def load(self):
+        """Load statistics from stats_file (missing, broken or malformed entries are ignored)."""
+        if self.stats_file is None or not self.stats_file.exists():
+            return
+        try:
+            with open(self.stats_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            self.logger.warning(f"Failed to load RPC stats {self.stats_file}: {e}")
+            return
+
+        if not isinstance(data, dict):
+            self.logger.warning(f"Ignoring RPC stats {self.stats_file}: expected an object")
+            return
+
+        for method, entry in data.items():
+            if self._valid_entry(entry):
+                self.methods[method] = {key: entry[key] for key in self.FIELDS}
+            else:
+                self.logger.warning(f"Ignoring malformed RPC stats entry for {method}")
+
+    @classmethod
+    def _valid_entry(cls, entry: Any) -> bool:
+        """Check that an entry has all fields as non-negative numbers."""
+        return isinstance(entry, dict) and all(
+            isinstance(entry.get(key), (int, float)) and not isinstance(entry.get(key), bool) and entry[key] >= 0
+            for key in cls.FIELDS
+        )
+
+    def save(self):
+        """Write statistics to stats_file if anything was measured (atomically, via a temp file)."""
+        if self.stats_file is None or not self._dirty:
+            return
+        try:
+            with self._lock:
+                write_json_atomic(self.stats_file, self.methods, indent=2)
+                self._dirty = False
+        except Exception as e:
+            self.logger.warning(f"Failed to save RPC stats {self.stats_file}: {e}")
+
+    def record(self, method: str, latency: float, request_bytes: int, response_bytes: int):
+        """Add one measurement."""
+        with self._lock:
+            entry = self.methods.get(method)
+            if entry is None:
+                self.methods[method] = {
+                    "count": 1,
+                    "latency": latency,
+                    "request_bytes": request_bytes,
+                    "response_bytes": response_bytes,
+                }
+            else:
+                entry["count"] += 1
+                for key, value in (("latency", latency), ("request_bytes", request_bytes), ("response_bytes", response_bytes)):
+                    entry[key] += (value - entry[key]) * STATS_SMOOTHING
+            self._dirty = True
+
+    def get(self, method: str) -> Optional[Dict[str, float]]:
+        """Get measurements for a method (None if never measured)."""
+        with self._lock:
+            entry = self.methods.get(method)
+            return dict(entry) if entry else None
+
+
+class DryRunPlan:
+    """
+    Record of every RPC a run issues (executed or skipped by dry-run).
+
+    snapshot()/diff() attribute calls to a part of the run (e.g. one manifest job);
+    estimate() turns a set of calls into bytes and wall-clock predictions.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def record(self, method: str, request_bytes: int, targets: int = 0):
+        """Add one RPC."""
+        with self._lock:
+            entry = self._calls.setdefault(method, {"count": 0, "request_bytes": 0, "targets": 0})
+            entry["count"] += 1
+            entry["request_bytes"] += request_bytes
+            entry["targets"] += targets
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        """Copy of the calls recorded so far."""
+        with self._lock:
+            return {method: dict(entry) for method, entry in self._calls.items()}
+
+    @staticmethod
+    def diff(after: Dict[str, Dict[str, int]], before: Dict[str, Dict[str, int]]) -> Dict[str, Dict[str, int]]:
+        """Calls recorded between two snapshots."""
+        result = {}
+        for method, entry in after.items():
+            prev = before.get(method, {})
+            delta = {key: value - prev.get(key, 0) for key, value in entry.items()}
+            if delta["count"]:
+                result[method] = delta
+        return result
+
+    @staticmethod
+    def _ramp_seconds(count: int, latency: float, max_concurrency: int) -> float:
+        """Time for count parallel calls under AIMD growth from 1 to max_concurrency."""
+        rounds = 0
+        limit = 1
+        remaining = count
+        while remaining > 0:
+            remaining -= limit
+            rounds += 1
+            limit = min(max_concurrency, limit + 1)
+        return rounds * latency
+
+    @staticmethod
+    def estimate(calls: Dict[str, Dict[str, int]], stats: RpcStats, max_concurrency: int) -> Dict[str, Any]:
+        """
+        Estimate bytes and duration for a set of calls.
+
+        Returns per-method rows plus 'serial_seconds' (non-parallel methods),
+        'parallel_seconds' (info lookups, AIMD ramp-up included),
+        'worst_case_seconds' (everything one by one) and byte totals.
+        'unmeasured' lists methods without measurements; their responses are
+        not in 'response_bytes', which is then a lower bound.
+        """
+        rows = []
+        unmeasured = []
+        serial = parallel = worst = 0.0
+        request_total = response_total = 0
+        for method, entry in sorted(calls.items()):
+            measured = stats.get(method)
+            latency = measured["latency"] if measured else DEFAULT_LATENCY_ESTIMATE
+            response_bytes = int(measured["response_bytes"] * entry["count"]) if measured else None
+            if not measured:
+                unmeasured.append(method)
+
+            if method in PARALLEL_METHODS:
+                seconds = DryRunPlan._ramp_seconds(entry["count"], latency, max_concurrency)
+                parallel += seconds
+            else:
+                seconds = entry["count"] * latency
+                serial += seconds
+            worst += entry["count"] * latency
+
+            request_total += entry["request_bytes"]
+            response_total += response_bytes or 0
+            rows.append({
+                "method": method,
+                "count": entry["count"],
+                "targets": entry["targets"],
+                "request_bytes": entry["request_bytes"],
+                "response_bytes": response_bytes,
+                "latency": latency,
+                "measured": measured["count"] if measured else 0,
+                "seconds": seconds,
+            })
+
+        return {
+            "rows": rows,
+            "serial_seconds": serial,
+            "parallel_seconds": parallel,
+            "worst_case_seconds": worst,
+            "request_bytes": request_total,
+            "response_bytes": response_total,
+            "unmeasured": unmeasured,
+        }
+
+    def log_report(
+        self,
+        stats: RpcStats,
+        max_concurrency: int,
+        setup_calls: Dict[str, Dict[str, int]],
+        waves: List[List[Tuple[str, Dict[str, Dict[str, int]]]]],
+    ):
+        """
+        Log the execution plan.
+
+        setup_calls: calls made before the command (login, inventory export)
+        waves: groups of (label, calls) that run concurrently; waves run one after another
+        """
+        total = self.estimate(self.snapshot(), stats, max_concurrency)
+
+        self.logger.info("[PLAN] RPC calls by method:")
+        for row in total["rows"]:
+            source = f"measured n={row['measured']}" if row["measured"] else "default"
+            targets = f", {row['targets']} targets" if row["targets"] else ""
+            response = _format_bytes(row["response_bytes"]) if row["response_bytes"] is not None else "n/a"
+            self.logger.info(
+                f"[PLAN]   {_short_method(row['method'])}: {row['count']} calls{targets}, "
+                f"request {_format_bytes(row['request_bytes'])}, response ~{response}, "
+                f"{row['latency']:.2f}s/call ({source})"
+            )
+
+        # Setup runs once, then each wave takes as long as its slowest job;
+        # info lookups within a wave share the adaptive concurrency limit
+        setup = self.estimate(setup_calls, stats, max_concurrency)
+        predicted = setup["serial_seconds"] + setup["parallel_seconds"]
+        self.logger.info(f"[PLAN] Setup (login, inventory export): ~{predicted:.1f}s")
+        for index, wave in enumerate(waves, 1):
+            merged: Dict[str, Dict[str, int]] = {}
+            slowest_serial = 0.0
+            for label, calls in wave:
+                job = self.estimate(calls, stats, max_concurrency)
+                slowest_serial = max(slowest_serial, job["serial_seconds"])
+                summary = ", ".join(f"{_short_method(m)} x{e['count']}" for m, e in sorted(calls.items())) or "no RPCs"
+                self.logger.info(f"[PLAN] Wave {index} / {label}: {summary}")
+                for method, entry in calls.items():
+                    target = merged.setdefault(method, {"count": 0, "request_bytes": 0, "targets": 0})
+                    for key in target:
+                        target[key] += entry[key]
+            wave_seconds = slowest_serial + self.estimate(merged, stats, max_concurrency)["parallel_seconds"]
+            self.logger.info(f"[PLAN] Wave {index}: ~{wave_seconds:.1f}s")
+            predicted += wave_seconds
+
+        self.logger.info(
+            f"[PLAN] Info lookups use up to {max_concurrency} concurrent requests (AIMD ramp-up from 1)"
+        )
+        response = f"~{_format_bytes(total['response_bytes'])}"
+        if total["unmeasured"]:
+            missing = ", ".join(_short_method(m) for m in total["unmeasured"])
+            response = f">= {_format_bytes(total['response_bytes'])} (not measured: {missing})"
+        self.logger.info(
+            f"[PLAN] Total: {sum(r['count'] for r in total['rows'])} RPCs, "
+            f"request {_format_bytes(total['request_bytes'])}, response {response}"
+        )
+        self.logger.info(
+            f"[PLAN] Estimated wall-clock: ~{predicted:.1f}s "
+            f"(one request at a time: ~{total['worst_case_seconds']:.1f}s)"
+        )
+
+
 # ============================================================================
 # ESET API Client
 # ============================================================================
@@ -124,15 +570,34 @@ def load_config(config_file: Optional[Path] = None) -> Dict[str, Any]:
 class ESETAPIClient:
     """ESET PROTECT On-Prem 11.1 JSON-RPC API Client."""
 
-    def __init__(self, config: Dict[str, Any], dry_run: bool = False):
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        dry_run: bool = False,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        stats: Optional[RpcStats] = None,
+    ):
         self.config = config
         self.dry_run = dry_run
+        self.stats = stats or RpcStats()
+        self.plan = DryRunPlan()
         # HTTP or HTTPS based on configuration
         protocol = "http" if config.get("use_http", False) else "https"
         self.base_url = f"{protocol}://{config['host']}:{config['port']}/api"
         self.session_token: Optional[str] = None
         self.logger = logging.getLogger(self.__class__.__name__)
 
+        # Adaptive limit on in-flight requests, shared by all threads using this client
+        self.concurrency = AdaptiveConcurrencyController(
+            max_limit=config.get("max_concurrency", DEFAULT_MAX_CONCURRENCY),
+        )
+
+        # Inventory snapshot shared by name lookups (see load_inventory)
+        self._inventory: Optional[List[Dict[str, Any]]] = None
+        self._inventory_index: Optional[Dict[str, Dict[str, Any]]] = None
+        self._inventory_compact = False
+        self._inventory_lock = threading.Lock()
+
         # Setup HTTP session with retry
         self.session = requests.Session()
         retry_strategy = Retry(
@@ -141,7 +606,11 @@ class ESETAPIClient:
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["POST"],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Pool size should cover the number of concurrent workers sharing this session
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_maxsize=max(pool_maxsize, self.concurrency.max_limit),
+        )
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
 
@@ -170,26 +639,42 @@ class ESETAPIClient:
         self.logger.debug(f"RPC Call: {method}")
         self.logger.debug(f"Payload: {json.dumps(self._mask_password(payload), indent=2)}")
 
-        if self.dry_run and method != "Era.Common.NetworkMessage.ConsoleApi.SessionManagement.RpcAuthLoginRequest":
+        body = json.dumps(payload).encode("utf-8")
+        self.plan.record(method, len(body), targets=len(params.get("targets", ())))
+
+        if self.dry_run and method not in DRY_RUN_ALLOWED_METHODS:
             self.logger.info(f"[DRY-RUN] Would call {method} with params: {self._mask_password(params)}")
             return {"success": True, "dry_run": True}
 
+        started = self.concurrency.acquire()
+        success: Optional[bool] = False
         try:
             response = self.session.post(
                 self.base_url,
-                json=payload,
+                data=body,
                 headers=headers,
                 timeout=self.config["timeout"],
             )
             response.raise_for_status()
+            self.stats.record(method, time.monotonic() - started, len(body), len(response.content))
 
             result = response.json()
+            success = True
             self.logger.debug(f"Response: {json.dumps(result, indent=2)[:500]}...")
 
             return result
+        except requests.exceptions.HTTPError as e:
+            # Client errors (other than 429) are not a sign of server load
+            status = e.response.status_code if e.response is not None else None
+            if status is not None and status < 500 and status != 429:
+                success = None
+            self.logger.error(f"API call failed: {e}")
+            raise
         except requests.exceptions.RequestException as e:
             self.logger.error(f"API call failed: {e}")
             raise
+        finally:
+            self.concurrency.release(method, started, success)
 
     def login(self) -> bool:
         """Authenticate and get session token.
@@ -242,7 +727,7 @@ class ESETAPIClient:
         """Get list of computers (optionally filtered by group)."""
         # NOTE: 実際のAPI仕様に基づく形式（parentGroupUuidはオブジェクト形式）
         params: Dict[str, Any] = {
-            "parentGroupUuid": {"uuid": parent_group_uuid or "00000000-0000-0000-0000-000000000000"}
+            "parentGroupUuid": {"uuid": parent_group_uuid or ALL_COMPUTERS_GROUP_UUID}
         }
 
         result = self._rpc_call(
@@ -264,15 +749,81 @@ class ESETAPIClient:
             return response_data.get("computers", [])
         return []
 
+    def load_inventory(self, refresh: bool = False, cache_file: Optional[Path] = None) -> List[Dict[str, Any]]:
+        """Export all computers once and keep the snapshot for later name lookups.
+
+        While a snapshot is loaded, get_computer_by_name() searches it instead of
+        running a full export per lookup. Safe to call from multiple threads.
+
+        With cache_file, dry-runs reuse the cached export if it exists; every
+        real export is written back to the cache.
+        """
+        with self._inventory_lock:
+            if self._inventory is not None and not refresh:
+                return self._inventory
+
+            if cache_file is not None and self.dry_run and cache_file.exists():
+                with open(cache_file, "r", encoding="utf-8") as f:
+                    self._set_inventory(json.load(f))
+                # The real run will export, so the plan counts it
+                method = f"{API_GROUPS}.RpcExportComputersRequest"
+                payload = {method: {"parentGroupUuid": {"uuid": ALL_COMPUTERS_GROUP_UUID}}}
+                self.plan.record(method, len(json.dumps(payload).encode("utf-8")))
+                self.logger.info(f"Loaded inventory snapshot from cache {cache_file}: {len(self._inventory)} computers")
+                return self._inventory
+
+            self._set_inventory(self.get_computers())
+            self.logger.info(f"Loaded inventory snapshot: {len(self._inventory)} computers")
+            if cache_file is not None:
+                # The cache is optional: a failed write must not stop the run
+                try:
+                    write_json_atomic(cache_file, self._inventory)
+                except OSError as e:
+                    self.logger.warning(f"Failed to write inventory cache {cache_file}: {e}")
+            return self._inventory
+
+    def _set_inventory(self, computers: List[Dict[str, Any]]):
+        """Store an inventory snapshot and index it by lower-cased name."""
+        self._inventory_compact = False
+        index: Dict[str, Dict[str, Any]] = {}
+        for comp in computers:
+            # First entry wins, as with a linear search
+            index.setdefault(self._computer_name(comp).lower(), comp)
+        self._inventory = computers
+        self._inventory_index = index
+
+    def compact_inventory(self):
+        """
+        Shrink the inventory snapshot to what name lookups need (name -> uuid).
+
+        Used in memory-budget mode; info rows then rely on the detail response
+        for everything except name and uuid.
+        """
+        with self._inventory_lock:
+            if self._inventory is None or self._inventory_compact:
+                return
+            self._set_inventory([
+                {"name": self._computer_name(comp), "uuid": comp.get("uuid") or comp.get("computerUuid")}
+                for comp in self._inventory
+            ])
+            self._inventory_compact = True
+        gc.collect()
+        self.logger.info(f"Compacted inventory snapshot to name/uuid ({len(self._inventory)} computers)")
+
+    @staticmethod
+    def _computer_name(comp: Dict[str, Any]) -> str:
+        """Name of a computer entry."""
+        # NOTE: Field name may be 'name', 'computerName', 'hostname', etc.
+        return comp.get("name") or comp.get("computerName") or comp.get("hostname", "")
+
     def get_computer_by_name(self, computer_name: str) -> Optional[Dict[str, Any]]:
         """Find computer by name."""
-        computers = self.get_computers()
+        if self._inventory_index is not None:
+            return self._inventory_index.get(computer_name.lower())
 
         # Case-insensitive search
-        for comp in computers:
-            # NOTE: Field name may be 'name', 'computerName', 'hostname', etc.
-            comp_name = comp.get("name") or comp.get("computerName") or comp.get("hostname", "")
-            if comp_name.lower() == computer_name.lower():
+        for comp in self.get_computers():
+            if self._computer_name(comp).lower() == computer_name.lower():
                 return comp
 
         return None
@@ -458,6 +1009,208 @@ class ComputerInfoExtractor:
         return str(ts)
 
 
+# ============================================================================
+# Profiling / Memory Budget
+# ============================================================================
+
+def get_rss_bytes() -> Optional[int]:
+    """Current resident set size in bytes (None if it cannot be determined)."""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+
+    # Linux without psutil: /proc/self/statm (second field = resident pages)
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _format_bytes(size: Optional[int]) -> str:
+    """Format byte count for log output."""
+    if size is None:
+        return "n/a"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KiB"
+    return f"{size / (1024 * 1024):.1f} MiB"
+
+
+class RunProfiler:
+    """
+    Capture cProfile stats and tracemalloc snapshots at checkpoints.
+
+    Disabled (all methods are no-ops) when output_dir is None.
+    Output files in output_dir:
+        NN_<label>.tracemalloc   snapshot per checkpoint (load with tracemalloc.Snapshot.load)
+        cpu.pstats               CPU profile of all threads (load with pstats / snakeviz)
+
+    Python 3.12+ profiles every thread from the main profiler. Older versions
+    only hook the enabling thread, so worker code is wrapped in thread_profile()
+    and its stats are merged into cpu.pstats.
+    """
+
+    # cProfile on 3.12+ uses sys.monitoring: global, and only one profiler at a time
+    PER_THREAD = sys.version_info < (3, 12)
+
+    def __init__(self, output_dir: Optional[Path] = None, top_n: int = PROFILE_TOP_N):
+        self.output_dir = output_dir
+        self.enabled = output_dir is not None
+        self.top_n = top_n
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._profile: Optional[cProfile.Profile] = None
+        self._previous: Optional[tracemalloc.Snapshot] = None
+        self._count = 0
+        self._lock = threading.Lock()
+        self._thread_stats: Optional[pstats.Stats] = None
+        self._thread_local = threading.local()
+
+    def start(self):
+        """Start tracemalloc and CPU profiling."""
+        if not self.enabled:
+            return
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        tracemalloc.start()
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+        self.logger.info(f"Profiling enabled, writing to {self.output_dir}")
+
+    def checkpoint(self, label: str):
+        """Take a tracemalloc snapshot and log memory usage and top allocation growth."""
+        if not self.enabled or not tracemalloc.is_tracing():
+            return
+
+        # Keep checkpoint overhead out of the CPU profile (profiler is bound to the main thread)
+        pause_cpu = self._profile is not None and threading.current_thread() is threading.main_thread()
+        if pause_cpu:
+            self._profile.disable()
+
+        with self._lock:
+            self._count += 1
+            snapshot = tracemalloc.take_snapshot()
+            snapshot.dump(str(self.output_dir / f"{self._count:02d}_{label}.tracemalloc"))
+
+            current, peak = tracemalloc.get_traced_memory()
+            self.logger.info(
+                f"[PROFILE] {label}: rss={_format_bytes(get_rss_bytes())} "
+                f"traced={_format_bytes(current)} peak={_format_bytes(peak)}"
+            )
+
+            if self._previous is not None:
+                stats = snapshot.compare_to(self._previous, "lineno")
+            else:
+                stats = snapshot.statistics("lineno")
+            stats = [stat for stat in stats if stat.traceback[0].filename != tracemalloc.__file__]
+            for stat in stats[:self.top_n]:
+                self.logger.info(f"[PROFILE]   {stat}")
+
+            # Keep only the latest snapshot for diffing
+            self._previous = snapshot
+
+        if pause_cpu:
+            self._profile.enable()
+
+    @contextlib.contextmanager
+    def thread_profile(self):
+        """CPU-profile the enclosed block when it runs on a worker thread (Python < 3.12)."""
+        if (
+            not self.PER_THREAD
+            or self._profile is None
+            or threading.current_thread() is threading.main_thread()
+            or getattr(self._thread_local, "active", False)
+        ):
+            yield
+            return
+
+        profile = cProfile.Profile()
+        self._thread_local.active = True
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            self._thread_local.active = False
+            with self._lock:
+                if self._thread_stats is None:
+                    self._thread_stats = pstats.Stats(profile)
+                else:
+                    self._thread_stats.add(profile)
+
+    def stop(self):
+        """Stop profiling and write CPU stats."""
+        if not self.enabled or self._profile is None:
+            return
+
+        self._profile.disable()
+        buffer = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=buffer)
+        if self._thread_stats is not None:
+            stats.add(self._thread_stats)
+        stats_file = self.output_dir / "cpu.pstats"
+        stats.dump_stats(str(stats_file))
+
+        stats.sort_stats("cumulative").print_stats(self.top_n)
+        self.logger.info(f"[PROFILE] CPU profile written to {stats_file}\n{buffer.getvalue()}")
+
+        self._profile = None
+        self._thread_stats = None
+        self._previous = None
+        tracemalloc.stop()
+
+
+class MemoryBudget:
+    """
+    RSS threshold that switches the run to streaming/low-retention behavior.
+
+    Once exceeded it stays exceeded for the rest of the run.
+    Falls back to tracemalloc's traced memory when RSS is unavailable.
+    """
+
+    def __init__(self, limit_mb: Optional[int] = None):
+        if limit_mb is not None and limit_mb < 1:
+            raise ValueError(f"Memory budget must be a positive number of MB, got {limit_mb}")
+        self.limit_bytes = limit_mb * 1024 * 1024 if limit_mb is not None else None
+        self.triggered = False
+        self._warned_unmeasurable = False
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def enabled(self) -> bool:
+        return self.limit_bytes is not None
+
+    def _usage(self) -> Optional[int]:
+        rss = get_rss_bytes()
+        if rss is None and tracemalloc.is_tracing():
+            return tracemalloc.get_traced_memory()[0]
+        return rss
+
+    def exceeded(self) -> bool:
+        """Check memory usage against the budget."""
+        if not self.enabled:
+            return False
+        if self.triggered:
+            return True
+
+        usage = self._usage()
+        if usage is None:
+            if not self._warned_unmeasurable:
+                self._warned_unmeasurable = True
+                self.logger.warning(
+                    "Cannot measure memory usage on this platform (install psutil); --memory-budget has no effect"
+                )
+            return False
+        if usage > self.limit_bytes:
+            self.triggered = True
+            self.logger.warning(
+                f"Memory budget exceeded ({_format_bytes(usage)} > {_format_bytes(self.limit_bytes)}), "
+                f"switching to streaming mode"
+            )
+            gc.collect()
+        return self.triggered
+
+
 # ============================================================================
 # Main Application Logic
 # ============================================================================
@@ -465,8 +1218,15 @@ class ComputerInfoExtractor:
 class ESETManager:
     """Main ESET Manager application."""
 
-    def __init__(self, client: ESETAPIClient):
+    def __init__(
+        self,
+        client: ESETAPIClient,
+        profiler: Optional[RunProfiler] = None,
+        memory_budget: Optional[MemoryBudget] = None,
+    ):
         self.client = client
+        self.profiler = profiler or RunProfiler()
+        self.memory_budget = memory_budget or MemoryBudget()
         self.logger = logging.getLogger(self.__class__.__name__)
 
     def read_computer_names_from_csv(self, csv_file: Path) -> List[str]:
@@ -503,23 +1263,43 @@ class ESETManager:
 
     def get_computer_info_list(self, computer_names: List[str]) -> List[Dict[str, Any]]:
         """Get information for multiple computers."""
-        results = []
+        return list(self.iter_computer_info(computer_names))
 
-        for i, name in enumerate(computer_names, 1):
-            self.logger.info(f"Processing {i}/{len(computer_names)}: {name}")
+    def iter_computer_info(self, computer_names: List[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield information for each computer (in input order) as soon as it has been fetched.
+
+        Lookups run on a thread pool; the client's concurrency controller
+        decides how many requests are actually in flight.
+        """
+        max_workers = self.client.concurrency.max_limit
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Bounded look-ahead keeps finished-but-unconsumed results small
+            pending: deque = deque()
+            for i, name in enumerate(computer_names, 1):
+                pending.append(executor.submit(self._fetch_computer_info, i, len(computer_names), name))
+                if len(pending) >= max_workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def _fetch_computer_info(self, index: int, total: int, name: str) -> Dict[str, Any]:
+        """Find one computer and extract its information (errors are returned as rows)."""
+        with self.profiler.thread_profile():
+            self.logger.info(f"Processing {index}/{total}: {name}")
 
             try:
                 # Find computer
                 computer = self.client.get_computer_by_name(name)
                 if not computer:
                     self.logger.warning(f"Computer not found: {name}")
-                    results.append({
+                    return {
                         "name": name,
                         "error": "Not found in ESET PROTECT",
-                    })
-                    continue
+                    }
 
-                # Get detailed info
+                # Get detailed info (copy first: the entry may belong to a shared inventory snapshot)
+                computer = dict(computer)
                 uuid = computer.get("uuid") or computer.get("computerUuid")
                 if uuid:
                     details = self.client.get_computer_details(uuid)
@@ -527,33 +1307,27 @@ class ESETManager:
                         computer.update(details)
 
                 # Extract info
-                info = ComputerInfoExtractor.extract_info(computer)
-                results.append(info)
+                return ComputerInfoExtractor.extract_info(computer)
 
             except Exception as e:
                 self.logger.error(f"Failed to get info for {name}: {e}")
-                results.append({
+                return {
                     "name": name,
                     "error": str(e),
-                })
-
-            # Avoid rate limiting
-            if i < len(computer_names):
-                time.sleep(0.5)
-
-        return results
+                }
 
-    def export_to_csv(self, results: List[Dict[str, Any]], output_file: Path):
-        """Export results to CSV file."""
+    def export_to_csv(self, results: List[Dict[str, Any]], output_file: Path, fieldnames: Optional[List[str]] = None):
+        """Export results to CSV file (columns: fieldnames, or all keys found in results)."""
         if not results:
             self.logger.warning("No results to export")
             return
 
-        # Get all unique keys
-        fieldnames = set()
-        for result in results:
-            fieldnames.update(result.keys())
-        fieldnames = sorted(fieldnames)
+        if fieldnames is None:
+            # Get all unique keys
+            keys = set()
+            for result in results:
+                keys.update(result.keys())
+            fieldnames = sorted(keys)
 
         with open(output_file, "w", encoding="utf-8", newline="") as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
@@ -617,11 +1391,322 @@ class ESETManager:
 
         return [result]
 
+    def run_info(self, csv_file: Path, output_file: Path) -> Dict[str, int]:
+        """
+        Run the 'info' command: read names, fetch info, export results.
+
+        Results are buffered and exported at the end, unless the memory budget
+        is exceeded: then buffered rows are flushed and the rest is streamed
+        to the output file row by row. Dry-runs write nothing.
+        """
+        computer_names = self.read_computer_names_from_csv(csv_file)
+
+        results: List[Dict[str, Any]] = []
+        total = connected = 0
+        streaming = False
+        stream_file = None
+        writer = None
+        try:
+            for info in self.iter_computer_info(computer_names):
+                total += 1
+                if info.get("connected"):
+                    connected += 1
+
+                if streaming:
+                    if writer is not None:
+                        writer.writerow(info)
+                    continue
+
+                results.append(info)
+                if (total == 1 or total % MEMORY_CHECK_INTERVAL == 0) and self.memory_budget.exceeded():
+                    self.client.compact_inventory()
+                    streaming = True
+                    if not self.client.dry_run:
+                        stream_file = open(output_file, "w", encoding="utf-8", newline="")
+                        writer = csv.DictWriter(stream_file, fieldnames=self._info_fieldnames())
+                        writer.writeheader()
+                        writer.writerows(results)
+                    results.clear()
+        finally:
+            if stream_file is not None:
+                stream_file.close()
+
+        self.profiler.checkpoint("after_detail_fetch")
+
+        if self.client.dry_run:
+            self.logger.info(f"[DRY-RUN] Would write {total} rows to {output_file}")
+        elif not streaming:
+            # Same columns as the streaming path, so output does not depend on the budget
+            self.export_to_csv(results, output_file, fieldnames=self._info_fieldnames())
+        else:
+            self.logger.info(f"Streamed {total} results to {output_file}")
+        self.profiler.checkpoint("after_export_to_csv")
+
+        # Summary
+        self.logger.info(f"Summary: {total} total, {connected} connected")
+        return {"total": total, "connected": connected}
+
+    @staticmethod
+    def _info_fieldnames() -> List[str]:
+        """Fixed CSV columns for streamed info output."""
+        return sorted(set(ComputerInfoExtractor.extract_info({}).keys()) | {"error"})
+
+    def run_task(
+        self,
+        csv_file: Path,
+        task_type: str,
+        output_file: Optional[Path] = None,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        command: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Run the 'task' command: read names, create the task, optionally export results."""
+        computer_names = self.read_computer_names_from_csv(csv_file)
+
+        task_kwargs = {}
+        if name:
+            task_kwargs["task_name"] = name
+        if description:
+            task_kwargs["description"] = description
+        if command and task_type == "RunCommand":
+            task_kwargs["command"] = command
+
+        results = self.execute_task(computer_names, task_type, **task_kwargs)
+
+        if output_file:
+            if self.client.dry_run:
+                self.logger.info(f"[DRY-RUN] Would write {len(results)} rows to {output_file}")
+            else:
+                self.export_to_csv(results, output_file)
+        return results
+
+
+# ============================================================================
+# Batch Job Manifest
+# ============================================================================
+
+def load_manifest(manifest_file: Path) -> Dict[str, Any]:
+    """
+    Load a job manifest from JSON or YAML (.yaml/.yml, requires PyYAML).
+
+    Format:
+        {
+            "max_workers": 4,          # optional, concurrent jobs
+            "sequential": false,       # optional, run jobs strictly in listed order
+            "jobs": [
+                {"id": "pull", "action": "info", "csv": "pcs.csv", "output": "info.csv"},
+                {"id": "update", "action": "task", "csv": "pcs.csv", "type": "Update",
+                 "depends_on": ["pull"]},
+                {"action": "task", "csv": "srv.csv", "type": "RunCommand",
+                 "command": "ipconfig /all", "output": "srv_task.csv"}
+            ]
+        }
+
+    Task jobs accept the same options as the 'task' subcommand
+    (type, name, description, command, output). Relative paths are
+    resolved against the manifest's directory.
+    """
+    if not manifest_file.exists():
+        raise FileNotFoundError(f"Manifest file not found: {manifest_file}")
+
+    with open(manifest_file, "r", encoding="utf-8") as f:
+        if manifest_file.suffix.lower() in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError("YAML manifests require PyYAML. Run: pip install pyyaml (or use a .json manifest)")
+            manifest = yaml.safe_load(f)
+        else:
+            manifest = json.load(f)
+
+    if isinstance(manifest, list):
+        manifest = {"jobs": manifest}
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("jobs"), list) or not manifest["jobs"]:
+        raise ValueError(f"Manifest {manifest_file} must contain a non-empty 'jobs' list")
+
+    base_dir = manifest_file.parent
+    jobs = []
+    seen_ids = set()
+    for i, raw_job in enumerate(manifest["jobs"], 1):
+        if not isinstance(raw_job, dict):
+            raise ValueError(f"Job #{i}: must be a mapping")
+
+        job = dict(raw_job)
+        job["id"] = str(job.get("id") or f"job{i}")
+        if job["id"] in seen_ids:
+            raise ValueError(f"Job #{i}: duplicate id '{job['id']}'")
+        seen_ids.add(job["id"])
+
+        action = job.get("action")
+        if action not in ("info", "task"):
+            raise ValueError(f"Job '{job['id']}': action must be 'info' or 'task', got {action!r}")
+        if not job.get("csv"):
+            raise ValueError(f"Job '{job['id']}': 'csv' is required")
+        if action == "info" and not job.get("output"):
+            raise ValueError(f"Job '{job['id']}': 'output' is required for info jobs")
+        if action == "task" and job.get("type") not in TASK_TYPES:
+            raise ValueError(f"Job '{job['id']}': invalid task type {job.get('type')!r}. Valid: {list(TASK_TYPES.keys())}")
+
+        for key in ("csv", "output"):
+            if job.get(key):
+                path = Path(job[key])
+                job[key] = path if path.is_absolute() else base_dir / path
+
+        depends_on = job.get("depends_on") or []
+        if isinstance(depends_on, str):
+            depends_on = [depends_on]
+        job["depends_on"] = [str(dep) for dep in depends_on]
+        jobs.append(job)
+
+    # Validate dependencies
+    for job in jobs:
+        for dep in job["depends_on"]:
+            if dep not in seen_ids:
+                raise ValueError(f"Job '{job['id']}': unknown dependency '{dep}'")
+            if dep == job["id"]:
+                raise ValueError(f"Job '{job['id']}': cannot depend on itself")
+
+    # Sequential manifests chain each job to the previous one
+    if manifest.get("sequential"):
+        for prev, job in zip(jobs, jobs[1:]):
+            if prev["id"] not in job["depends_on"]:
+                job["depends_on"].append(prev["id"])
+
+    # Reject cycles here, before login, rather than after other jobs already ran
+    scheduled = {job_id for wave in JobRunner.waves(jobs) for job_id in wave}
+    cyclic = [job["id"] for job in jobs if job["id"] not in scheduled]
+    if cyclic:
+        raise ValueError(f"Dependency cycle between jobs: {', '.join(cyclic)}")
+
+    max_workers = manifest.get("max_workers")
+    if max_workers is not None and (isinstance(max_workers, bool) or not isinstance(max_workers, int) or max_workers < 1):
+        raise ValueError(f"Manifest {manifest_file}: max_workers must be a positive integer, got {max_workers!r}")
+
+    return {
+        "max_workers": max_workers,
+        "jobs": jobs,
+    }
+
+
+class JobRunner:
+    """Run manifest jobs on one authenticated client and one inventory snapshot."""
+
+    def __init__(self, manager: ESETManager, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.manager = manager
+        # Dry-runs execute one job at a time so RPCs can be attributed to jobs
+        self.max_workers = 1 if manager.client.dry_run else max(1, max_workers)
+        self.job_calls: Dict[str, Dict[str, Dict[str, int]]] = {}
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @staticmethod
+    def waves(jobs: List[Dict[str, Any]]) -> List[List[str]]:
+        """Group job ids into dependency levels; jobs in one level can run concurrently."""
+        levels: Dict[str, int] = {}
+        remaining = {job["id"]: job["depends_on"] for job in jobs}
+        while remaining:
+            ready = [job_id for job_id, deps in remaining.items() if all(dep in levels for dep in deps)]
+            if not ready:
+                break  # dependency cycle, rejected by load_manifest()
+            for job_id in ready:
+                levels[job_id] = 1 + max((levels[dep] for dep in remaining[job_id]), default=-1)
+                del remaining[job_id]
+
+        result: List[List[str]] = [[] for _ in range(max(levels.values(), default=-1) + 1)]
+        for job in jobs:
+            if job["id"] in levels:
+                result[levels[job["id"]]].append(job["id"])
+        return result
+
+    def _run_job(self, job: Dict[str, Any]) -> Any:
+        """Execute a single job."""
+        self.logger.info(f"[{job['id']}] Starting {job['action']} job ({job['csv']})")
+        plan = self.manager.client.plan
+        before = plan.snapshot()
+        try:
+            with self.manager.profiler.thread_profile():
+                return self._dispatch_job(job)
+        finally:
+            self.job_calls[job["id"]] = plan.diff(plan.snapshot(), before)
+
+    def _dispatch_job(self, job: Dict[str, Any]) -> Any:
+        """Call the manager method for a job's action."""
+        if job["action"] == "info":
+            return self.manager.run_info(job["csv"], job["output"])
+        return self.manager.run_task(
+            job["csv"],
+            job["type"],
+            output_file=job.get("output"),
+            # Job id keeps default names distinct when task jobs start in the same second
+            name=job.get("name") or f"Task_{job['id']}_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+            description=job.get("description"),
+            command=job.get("command"),
+        )
+
+    def run(self, jobs: List[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Run jobs respecting depends_on; independent jobs run concurrently.
+
+        Jobs whose dependencies failed are skipped.
+        Returns mapping of job id -> status ('ok', 'failed', 'skipped').
+        """
+        # Take the inventory snapshot once so every job resolves names against it
+        self.manager.client.load_inventory()
+
+        status: Dict[str, str] = {}
+        pending = {job["id"]: job for job in jobs}
+        running: Dict[Any, str] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                # Schedule ready jobs (in manifest order) and skip those with failed dependencies
+                for job_id, job in list(pending.items()):
+                    dep_status = [status.get(dep) for dep in job["depends_on"]]
+                    if any(s in ("failed", "skipped") for s in dep_status):
+                        self.logger.warning(f"[{job_id}] Skipped: dependency did not succeed")
+                        status[job_id] = "skipped"
+                        del pending[job_id]
+                    elif all(s == "ok" for s in dep_status):
+                        running[executor.submit(self._run_job, job)] = job_id
+                        del pending[job_id]
+
+                if not running:
+                    # Remaining jobs wait on each other: dependency cycle
+                    for job_id in pending:
+                        self.logger.error(f"[{job_id}] Skipped: dependency cycle")
+                        status[job_id] = "skipped"
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job_id = running.pop(future)
+                    try:
+                        future.result()
+                        status[job_id] = "ok"
+                        self.logger.info(f"[{job_id}] Completed")
+                    except Exception as e:
+                        status[job_id] = "failed"
+                        self.logger.error(f"[{job_id}] Failed: {e}")
+
+        failed = sum(1 for s in status.values() if s != "ok")
+        self.logger.info(f"Manifest summary: {len(status)} jobs, {len(status) - failed} ok, {failed} failed/skipped")
+        return status
+
 
 # ============================================================================
 # CLI
 # ============================================================================
 
+def positive_int(value: str) -> int:
+    """argparse type for options that must be a positive integer."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {number}")
+    return number
+
+
 def setup_logging(verbose: bool = False):
     """Setup logging configuration."""
     level = logging.DEBUG if verbose else logging.INFO
@@ -641,8 +1726,11 @@ Examples:
   # Get info for computers in CSV
   %(prog)s info --csv computers.csv --output results.csv
 
-  # Install AV on specific computers (dry-run)
-  %(prog)s task --csv computers.csv --type SoftwareInstallation --dry-run
+  # Install AV on specific computers (dry-run: plan only, nothing is changed)
+  %(prog)s --dry-run task --csv computers.csv --type SoftwareInstallation
+
+  # Plan a manifest against a cached inventory
+  %(prog)s --dry-run --inventory-cache inventory.json run --manifest jobs.json
 
   # Uninstall AV
   %(prog)s task --csv computers.csv --type SoftwareUninstallation
@@ -650,18 +1738,32 @@ Examples:
   # Run custom command
   %(prog)s task --csv computers.csv --type RunCommand --command "ipconfig /all"
 
+  # Run several info/task jobs in one session
+  %(prog)s run --manifest jobs.json
+
+  # Profile a large info run and cap memory at 1 GiB
+  %(prog)s --profile ./profile --memory-budget 1024 info --csv all.csv --output results.csv
+
 Environment Variables:
   ESET_HOST          ESET server hostname/IP
   ESET_PORT          ESET server port (default: 2223)
   ESET_USERNAME      Username for authentication
   ESET_PASSWORD      Password for authentication
   ESET_VERIFY_SSL    Verify SSL certificates (default: true)
+  ESET_MAX_CONCURRENCY  Upper bound for adaptive in-flight requests (default: 4)
         """
     )
 
     parser.add_argument("-c", "--config", type=Path, help="Config file path (default: ~/.config/eset_manager/config.json)")
     parser.add_argument("-v", "--verbose", action="store_true", help="Verbose logging")
-    parser.add_argument("--dry-run", action="store_true", help="Dry-run mode (no actual API calls except login)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Dry-run mode: only login and inventory export are executed; prints an execution plan")
+    parser.add_argument("--inventory-cache", type=Path, metavar="FILE",
+                        help="Inventory export cache: written by every real export, reused by --dry-run")
+    parser.add_argument("--profile", type=Path, metavar="DIR",
+                        help="Write cProfile stats and tracemalloc snapshots to DIR")
+    parser.add_argument("--memory-budget", type=positive_int, metavar="MB",
+                        help="Switch to streaming/low-retention mode when RSS exceeds MB")
 
     subparsers = parser.add_subparsers(dest="command", help="Commands")
 
@@ -676,9 +1778,14 @@ Environment Variables:
     task_parser.add_argument("--type", required=True, choices=list(TASK_TYPES.keys()), help="Task type")
     task_parser.add_argument("--name", help="Task name (default: auto-generated)")
     task_parser.add_argument("--description", help="Task description")
-    task_parser.add_argument("--command", help="Command to run (for RunCommand task type)")
+    task_parser.add_argument("--command", dest="run_command", help="Command to run (for RunCommand task type)")
     task_parser.add_argument("--output", type=Path, help="Output CSV file for results")
 
+    # Run command
+    run_parser = subparsers.add_parser("run", help="Run info/task jobs from a manifest in one session")
+    run_parser.add_argument("--manifest", type=Path, required=True, help="Job manifest file (.json, .yaml/.yml)")
+    run_parser.add_argument("--max-workers", type=positive_int, help=f"Concurrent jobs (default: manifest value or {DEFAULT_MAX_WORKERS})")
+
     args = parser.parse_args()
 
     if not args.command:
@@ -688,46 +1795,79 @@ Environment Variables:
     setup_logging(args.verbose)
     logger = logging.getLogger("main")
 
+    profiler = RunProfiler(args.profile)
+    profiler.start()
+    stats: Optional[RpcStats] = None
+
     try:
         # Load config
         config = load_config(args.config)
 
+        # Load manifest before login so format errors fail fast
+        manifest = None
+        max_workers = 1
+        if args.command == "run":
+            manifest = load_manifest(args.manifest)
+            max_workers = args.max_workers or manifest["max_workers"] or DEFAULT_MAX_WORKERS
+
+        # Measured RPC latencies feed the dry-run estimates
+        stats = RpcStats(get_stats_path(args.config))
+        stats.load()
+
         # Create client
-        client = ESETAPIClient(config, dry_run=args.dry_run)
+        client = ESETAPIClient(
+            config,
+            dry_run=args.dry_run,
+            pool_maxsize=max(DEFAULT_POOL_MAXSIZE, max_workers),
+            stats=stats,
+        )
 
         # Login
         if not client.login():
             logger.error("Authentication failed")
             sys.exit(1)
+        profiler.checkpoint("after_login")
+
+        # Export inventory once; all name lookups use this snapshot
+        client.load_inventory(cache_file=args.inventory_cache)
+        profiler.checkpoint("after_export")
+        setup_calls = client.plan.snapshot()
 
         # Create manager
-        manager = ESETManager(client)
+        manager = ESETManager(client, profiler=profiler, memory_budget=MemoryBudget(args.memory_budget))
 
         # Execute command
+        waves: List[List[Tuple[str, Dict[str, Dict[str, int]]]]] = []
         if args.command == "info":
-            computer_names = manager.read_computer_names_from_csv(args.csv)
-            results = manager.get_computer_info_list(computer_names)
-            manager.export_to_csv(results, args.output)
-
-            # Summary
-            connected = sum(1 for r in results if r.get("connected"))
-            logger.info(f"Summary: {len(results)} total, {connected} connected")
+            manager.run_info(args.csv, args.output)
+            waves = [[("info", client.plan.diff(client.plan.snapshot(), setup_calls))]]
 
         elif args.command == "task":
-            computer_names = manager.read_computer_names_from_csv(args.csv)
-
-            task_kwargs = {}
-            if args.name:
-                task_kwargs["taskName"] = args.name
-            if args.description:
-                task_kwargs["description"] = args.description
-            if args.command and args.type == "RunCommand":
-                task_kwargs["command"] = args.command
-
-            results = manager.execute_task(computer_names, args.type, **task_kwargs)
-
-            if args.output:
-                manager.export_to_csv(results, args.output)
+            manager.run_task(
+                args.csv,
+                args.type,
+                output_file=args.output,
+                name=args.name,
+                description=args.description,
+                command=args.run_command,
+            )
+            waves = [[("task", client.plan.diff(client.plan.snapshot(), setup_calls))]]
+
+        elif args.command == "run":
+            runner = JobRunner(manager, max_workers=max_workers)
+            status = runner.run(manifest["jobs"])
+            waves = [
+                [(job_id, runner.job_calls.get(job_id, {})) for job_id in wave]
+                for wave in JobRunner.waves(manifest["jobs"])
+            ]
+            if any(s != "ok" for s in status.values()):
+                logger.error("One or more jobs did not complete")
+                if args.dry_run:
+                    client.plan.log_report(stats, client.concurrency.max_limit, setup_calls, waves)
+                sys.exit(1)
+
+        if args.dry_run:
+            client.plan.log_report(stats, client.concurrency.max_limit, setup_calls, waves)
 
         logger.info("Completed successfully")
 
@@ -737,6 +1877,10 @@ Environment Variables:
     except Exception as e:
         logger.error(f"Error: {e}", exc_info=args.verbose)
         sys.exit(1)
+    finally:
+        if stats is not None:
+            stats.save()
+        profiler.stop()
 
 
 if __name__ == "__main__":
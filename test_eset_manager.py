@@ -0,0 +1,613 @@
+#!/usr/bin/env python3
+"""Unit tests for eset_manager.py (pure logic, no ESET server needed)."""
+
+import argparse
+import json
+import pstats
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+import eset_manager as em
+from eset_manager import (
+    AdaptiveConcurrencyController,
+    DryRunPlan,
+    ESETAPIClient,
+    ESETManager,
+    JobRunner,
+    MemoryBudget,
+    RpcStats,
+    RunProfiler,
+    load_manifest,
+)
+
+LOGIN = f"{em.API_SESSION}.RpcAuthLoginRequest"
+EXPORT = f"{em.API_GROUPS}.RpcExportComputersRequest"
+GET_COMPUTER = f"{em.API_GROUPS}.RpcGetComputerRequest"
+CREATE_TASK = f"{em.API_TASKS}.RpcCreateClientTaskRequest"
+
+
+CLIENT_CONFIG = {"host": "localhost", "port": 2223, "retries": 0, "verify_ssl": True, "timeout": 1}
+
+
+class StubClient:
+    """In-memory stand-in for ESETAPIClient (no HTTP)."""
+
+    def __init__(self, computers=None, details=None, dry_run=False):
+        self.dry_run = dry_run
+        self.plan = DryRunPlan()
+        self.concurrency = AdaptiveConcurrencyController(max_limit=4)
+        self.computers = computers or []
+        self.details = details or {}
+        self.load_inventory_calls = 0
+        self.compact_calls = 0
+        self.tasks = []
+        self.task_hook = None
+        self._lock = threading.Lock()
+
+    def load_inventory(self, refresh=False, cache_file=None):
+        with self._lock:
+            self.load_inventory_calls += 1
+        return self.computers
+
+    def compact_inventory(self):
+        self.compact_calls += 1
+
+    def get_computers(self, parent_group_uuid=None):
+        raise AssertionError("lookups must use the inventory snapshot")
+
+    def get_computer_by_name(self, computer_name):
+        for comp in self.computers:
+            if comp["name"].lower() == computer_name.lower():
+                return comp
+        return None
+
+    def get_computer_details(self, computer_uuid):
+        return self.details.get(computer_uuid)
+
+    def create_client_task(self, task_type, target_uuids, task_name=None, description=None, **kwargs):
+        if self.task_hook:
+            self.task_hook()
+        with self._lock:
+            self.tasks.append({"type": task_type, "targets": target_uuids, "name": task_name})
+        return f"task-{len(self.tasks)}"
+
+
+class FixedBudget(MemoryBudget):
+    """Memory budget that reports exceeded from the Nth check on."""
+
+    def __init__(self, exceeded_from_check):
+        super().__init__(1)
+        self.exceeded_from_check = exceeded_from_check
+        self.checks = 0
+
+    def exceeded(self):
+        self.checks += 1
+        return self.checks >= self.exceeded_from_check
+
+
+def _write_csv(path, names):
+    path.write_text("name\n" + "".join(f"{name}\n" for name in names), encoding="utf-8")
+    return path
+
+
+def _complete(controller, method, latency, success=True):
+    """Run one request through the controller with a given latency."""
+    started = controller.acquire()
+    controller.release(method, started - latency, success)
+
+
+class TestAdaptiveConcurrencyController(unittest.TestCase):
+    def test_additive_increase_up_to_max(self):
+        c = AdaptiveConcurrencyController(max_limit=4)
+        for _ in range(50):
+            _complete(c, GET_COMPUTER, 0.01)
+        self.assertEqual(c.limit, 4)
+        self.assertEqual(c.in_flight, 0)
+
+    def test_baselines_are_per_method(self):
+        c = AdaptiveConcurrencyController(max_limit=8, initial_limit=8)
+        _complete(c, LOGIN, 0.0)
+        _complete(c, EXPORT, 5.0)
+        _complete(c, GET_COMPUTER, 0.5)
+        self.assertEqual(c.limit, 8)
+
+    def test_latency_spike_halves_limit(self):
+        c = AdaptiveConcurrencyController(max_limit=8, initial_limit=8)
+        _complete(c, GET_COMPUTER, 0.1)
+        _complete(c, GET_COMPUTER, 2.0)
+        self.assertEqual(c.limit, 4)
+
+    def test_one_decrease_per_round_trip(self):
+        c = AdaptiveConcurrencyController(max_limit=8, initial_limit=8, failure_threshold=100)
+        _complete(c, GET_COMPUTER, 0.1, success=False)
+        _complete(c, GET_COMPUTER, 0.1, success=False)
+        self.assertEqual(c.limit, 4)
+
+    def test_limit_never_below_minimum(self):
+        c = AdaptiveConcurrencyController(max_limit=8, initial_limit=2, failure_threshold=100)
+        for _ in range(3):
+            c._last_decrease = 0.0
+            _complete(c, GET_COMPUTER, 0.1, success=False)
+        self.assertEqual(c.limit, 1)
+
+    def test_neutral_outcome_only_frees_slot(self):
+        c = AdaptiveConcurrencyController(max_limit=8, initial_limit=4, failure_threshold=1)
+        _complete(c, GET_COMPUTER, 0.1, success=None)
+        self.assertEqual(c.limit, 4)
+        self.assertEqual(c.state, c.CLOSED)
+        self.assertEqual(c.in_flight, 0)
+
+    def test_success_resets_failure_count(self):
+        c = AdaptiveConcurrencyController(failure_threshold=3)
+        _complete(c, GET_COMPUTER, 0.1, success=False)
+        _complete(c, GET_COMPUTER, 0.1, success=False)
+        _complete(c, GET_COMPUTER, 0.1)
+        _complete(c, GET_COMPUTER, 0.1, success=False)
+        self.assertEqual(c.state, c.CLOSED)
+
+    def test_breaker_opens_after_consecutive_failures(self):
+        c = AdaptiveConcurrencyController(failure_threshold=3, cooldown=60)
+        for _ in range(3):
+            _complete(c, GET_COMPUTER, 0.1, success=False)
+        self.assertEqual(c.state, c.OPEN)
+
+    def test_open_breaker_blocks_until_cooldown(self):
+        c = AdaptiveConcurrencyController(failure_threshold=1, cooldown=0.2)
+        _complete(c, GET_COMPUTER, 0.1, success=False)
+        started = time.monotonic()
+        c.acquire()
+        self.assertGreaterEqual(time.monotonic() - started, 0.15)
+        self.assertEqual(c.state, c.HALF_OPEN)
+
+    def test_half_open_allows_single_probe(self):
+        c = AdaptiveConcurrencyController(max_limit=4, initial_limit=4, failure_threshold=1, cooldown=0.01)
+        _complete(c, GET_COMPUTER, 0.1, success=False)
+        probe = c.acquire()
+        self.assertEqual(c.state, c.HALF_OPEN)
+
+        waiter = threading.Thread(target=c.acquire)
+        waiter.start()
+        waiter.join(0.1)
+        self.assertTrue(waiter.is_alive(), "second request must wait for the probe")
+
+        c.release(GET_COMPUTER, probe, True)
+        waiter.join(1)
+        self.assertFalse(waiter.is_alive())
+        self.assertEqual(c.state, c.CLOSED)
+
+    def test_probe_success_closes_and_resets_cooldown(self):
+        c = AdaptiveConcurrencyController(failure_threshold=1, cooldown=0.01)
+        _complete(c, GET_COMPUTER, 0.1, success=False)
+        _complete(c, GET_COMPUTER, 0.1, success=False)  # probe fails, cooldown doubles
+        self.assertEqual(c.cooldown, 0.02)
+        _complete(c, GET_COMPUTER, 0.1)
+        self.assertEqual(c.state, c.CLOSED)
+        self.assertEqual(c.cooldown, 0.01)
+
+    def test_probe_failure_doubles_cooldown_up_to_cap(self):
+        c = AdaptiveConcurrencyController(failure_threshold=1, cooldown=200)
+        _complete(c, GET_COMPUTER, 0.1, success=False)
+        self.assertEqual(c.state, c.OPEN)
+
+        # Skip the wait: pretend the cooldown has elapsed before each probe
+        for expected in (em.BREAKER_MAX_COOLDOWN, em.BREAKER_MAX_COOLDOWN):
+            c._open_until = 0.0
+            _complete(c, GET_COMPUTER, 0.1, success=False)
+            self.assertEqual(c.state, c.OPEN)
+            self.assertEqual(c.cooldown, expected)
+
+
+class TestManifest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, manifest):
+        path = self.dir / "jobs.json"
+        path.write_text(json.dumps(manifest), encoding="utf-8")
+        return path
+
+    def test_defaults_and_relative_paths(self):
+        manifest = load_manifest(self._write({"jobs": [
+            {"action": "info", "csv": "pcs.csv", "output": "out.csv"},
+            {"action": "task", "csv": "pcs.csv", "type": "Update", "depends_on": "job1"},
+        ]}))
+        first, second = manifest["jobs"]
+        self.assertEqual(first["id"], "job1")
+        self.assertEqual(first["csv"], self.dir / "pcs.csv")
+        self.assertEqual(second["depends_on"], ["job1"])
+        self.assertIsNone(manifest["max_workers"])
+
+    def test_sequential_chains_jobs(self):
+        manifest = load_manifest(self._write({"sequential": True, "jobs": [
+            {"id": "a", "action": "info", "csv": "x.csv", "output": "a.csv"},
+            {"id": "b", "action": "info", "csv": "x.csv", "output": "b.csv"},
+            {"id": "c", "action": "info", "csv": "x.csv", "output": "c.csv"},
+        ]}))
+        self.assertEqual(JobRunner.waves(manifest["jobs"]), [["a"], ["b"], ["c"]])
+
+    def test_invalid_manifests(self):
+        info = {"action": "info", "csv": "x.csv", "output": "o.csv"}
+        cases = {
+            "empty": {"jobs": []},
+            "bad action": {"jobs": [{"action": "delete", "csv": "x.csv"}]},
+            "info without output": {"jobs": [{"action": "info", "csv": "x.csv"}]},
+            "bad task type": {"jobs": [{"action": "task", "csv": "x.csv", "type": "Nope"}]},
+            "duplicate id": {"jobs": [dict(info, id="a"), dict(info, id="a")]},
+            "unknown dependency": {"jobs": [dict(info, depends_on=["zzz"])]},
+            "self dependency": {"jobs": [dict(info, id="a", depends_on=["a"])]},
+            "cycle": {"jobs": [
+                dict(info, id="a"),
+                dict(info, id="b", depends_on=["c"]),
+                dict(info, id="c", depends_on=["b"]),
+            ]},
+            "max_workers string": {"max_workers": "2", "jobs": [info]},
+            "max_workers zero": {"max_workers": 0, "jobs": [info]},
+        }
+        for label, manifest in cases.items():
+            with self.subTest(label):
+                with self.assertRaises(ValueError):
+                    load_manifest(self._write(manifest))
+
+
+    def test_positive_int_option_type(self):
+        self.assertEqual(em.positive_int("3"), 3)
+        for value in ("0", "-5", "two"):
+            with self.subTest(value):
+                with self.assertRaises(argparse.ArgumentTypeError):
+                    em.positive_int(value)
+
+
+class TestJobRunnerWaves(unittest.TestCase):
+    def test_levels(self):
+        jobs = [
+            {"id": "a", "depends_on": []},
+            {"id": "b", "depends_on": ["a"]},
+            {"id": "c", "depends_on": []},
+            {"id": "d", "depends_on": ["b", "c"]},
+        ]
+        self.assertEqual(JobRunner.waves(jobs), [["a", "c"], ["b"], ["d"]])
+
+    def test_cycle_members_are_dropped(self):
+        jobs = [
+            {"id": "a", "depends_on": []},
+            {"id": "b", "depends_on": ["c"]},
+            {"id": "c", "depends_on": ["b"]},
+        ]
+        self.assertEqual(JobRunner.waves(jobs), [["a"]])
+
+
+class TestJobRunner(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self._tmp.name)
+        self.csv = _write_csv(self.dir / "pcs.csv", ["PC1", "PC2"])
+        self.client = StubClient(computers=[{"name": "PC1", "uuid": "1"}, {"name": "PC2", "uuid": "2"}])
+        self.manager = ESETManager(self.client)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _task(self, job_id, **extra):
+        return dict({"id": job_id, "action": "task", "csv": self.csv, "type": "Update", "depends_on": []}, **extra)
+
+    def test_failed_dependency_skips_dependents(self):
+        jobs = [
+            self._task("bad", csv=self.dir / "missing.csv"),
+            self._task("after_bad", depends_on=["bad"]),
+            self._task("independent"),
+        ]
+        status = JobRunner(self.manager, max_workers=2).run(jobs)
+        self.assertEqual(status, {"bad": "failed", "after_bad": "skipped", "independent": "ok"})
+        self.assertEqual(len(self.client.tasks), 1)
+
+    def test_dependencies_run_in_order(self):
+        jobs = [self._task("second", depends_on=["first"], name="second"), self._task("first", name="first")]
+        JobRunner(self.manager, max_workers=4).run(jobs)
+        self.assertEqual([task["name"] for task in self.client.tasks], ["first", "second"])
+
+    def test_independent_jobs_run_concurrently(self):
+        # Both jobs must be inside create_client_task at the same time to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+        self.client.task_hook = barrier.wait
+        status = JobRunner(self.manager, max_workers=2).run([self._task("a"), self._task("b")])
+        self.assertEqual(status, {"a": "ok", "b": "ok"})
+
+    def test_jobs_share_one_inventory_snapshot(self):
+        output = self.dir / "info.csv"
+        jobs = [
+            {"id": "info", "action": "info", "csv": self.csv, "output": output, "depends_on": []},
+            self._task("t1"),
+            self._task("t2", depends_on=["info"]),
+        ]
+        status = JobRunner(self.manager, max_workers=3).run(jobs)
+        self.assertEqual(set(status.values()), {"ok"})
+        self.assertEqual(self.client.load_inventory_calls, 1)
+        self.assertEqual([task["targets"] for task in self.client.tasks], [["1", "2"], ["1", "2"]])
+
+    def test_task_name_is_passed_through(self):
+        JobRunner(self.manager).run([self._task("a", name="MyTask")])
+        self.assertEqual(self.client.tasks[0]["name"], "MyTask")
+
+
+class TestMemoryBudget(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self._tmp.name)
+        names = [f"PC{i}" for i in range(7)] + ["MISSING"]
+        self.csv = _write_csv(self.dir / "pcs.csv", names)
+        computers = [{"name": f"PC{i}", "uuid": str(i)} for i in range(7)]
+        self.details = {str(i): {"connected": i % 2 == 0, "avVersion": f"10.{i}"} for i in range(7)}
+        self.computers = computers
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _run(self, budget, output_name):
+        client = StubClient(computers=self.computers, details=self.details)
+        manager = ESETManager(client, memory_budget=budget)
+        output = self.dir / output_name
+        summary = manager.run_info(self.csv, output)
+        return client, summary, output.read_text(encoding="utf-8")
+
+    def test_streaming_output_matches_buffered_export(self):
+        original_interval = em.MEMORY_CHECK_INTERVAL
+        em.MEMORY_CHECK_INTERVAL = 2
+        try:
+            _, buffered_summary, buffered = self._run(MemoryBudget(), "buffered.csv")
+            # Checks happen at rows 1, 2, 4, ...: exceeded on the third check switches mid-run
+            client, streamed_summary, streamed = self._run(FixedBudget(3), "streamed.csv")
+        finally:
+            em.MEMORY_CHECK_INTERVAL = original_interval
+
+        self.assertEqual(streamed, buffered)
+        self.assertEqual(streamed_summary, buffered_summary)
+        self.assertEqual(buffered_summary, {"total": 8, "connected": 4})
+        self.assertEqual(client.compact_calls, 1)
+        self.assertIn("error", buffered.splitlines()[0].split(","))
+
+    def test_no_streaming_without_budget(self):
+        client, _, _ = self._run(MemoryBudget(), "out.csv")
+        self.assertEqual(client.compact_calls, 0)
+
+    def test_rejects_non_positive_budget(self):
+        for value in (0, -5):
+            with self.subTest(value):
+                with self.assertRaises(ValueError):
+                    MemoryBudget(value)
+
+    def test_warns_once_when_memory_cannot_be_measured(self):
+        original = em.get_rss_bytes
+        em.get_rss_bytes = lambda: None
+        try:
+            budget = MemoryBudget(1)
+            with self.assertLogs("MemoryBudget", level="WARNING") as logs:
+                self.assertFalse(budget.exceeded())
+                self.assertFalse(budget.exceeded())
+        finally:
+            em.get_rss_bytes = original
+        self.assertEqual(len(logs.records), 1)
+
+
+class TestCompactInventory(unittest.TestCase):
+    def test_keeps_only_name_and_uuid(self):
+        client = ESETAPIClient(CLIENT_CONFIG, dry_run=True)
+        client._set_inventory([
+            {"name": "PC1", "uuid": "1", "security": {"version": "10"}, "operatingSystem": {"name": "Win"}},
+            {"computerName": "pc2", "computerUuid": "2", "lastSeen": "2025-01-01"},
+        ])
+
+        client.compact_inventory()
+
+        self.assertEqual(client._inventory, [{"name": "PC1", "uuid": "1"}, {"name": "pc2", "uuid": "2"}])
+        self.assertEqual(client.get_computer_by_name("pc1"), {"name": "PC1", "uuid": "1"})
+        self.assertEqual(client.get_computer_by_name("PC2")["uuid"], "2")
+
+
+class TestRunProfiler(unittest.TestCase):
+    def test_disabled_profiler_is_noop(self):
+        profiler = RunProfiler()
+        profiler.start()
+        profiler.checkpoint("after_login")
+        with profiler.thread_profile():
+            pass
+        profiler.stop()
+
+    def test_checkpoint_files_and_worker_stats(self):
+        def profiled_work():
+            return sum(i * i for i in range(1000))
+
+        def worker_function():
+            with profiler.thread_profile():
+                profiled_work()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp)
+            profiler = RunProfiler(out)
+            profiler.start()
+            try:
+                profiler.checkpoint("after_login")
+                worker = threading.Thread(target=worker_function)
+                worker.start()
+                worker.join()
+                profiler.checkpoint("after_export")
+            finally:
+                profiler.stop()
+
+            self.assertEqual(
+                sorted(p.name for p in out.iterdir()),
+                ["01_after_login.tracemalloc", "02_after_export.tracemalloc", "cpu.pstats"],
+            )
+            functions = {key[2] for key in pstats.Stats(str(out / "cpu.pstats")).stats}
+            self.assertIn("profiled_work", functions)
+
+
+class TestDryRunPlan(unittest.TestCase):
+    def test_ramp_seconds(self):
+        # Limit grows 1, 2, 3, 4, 4, ... per round
+        self.assertEqual(DryRunPlan._ramp_seconds(0, 1.0, 4), 0)
+        self.assertEqual(DryRunPlan._ramp_seconds(1, 1.0, 4), 1.0)
+        self.assertEqual(DryRunPlan._ramp_seconds(10, 1.0, 4), 4.0)
+        self.assertEqual(DryRunPlan._ramp_seconds(18, 1.0, 4), 6.0)
+        self.assertEqual(DryRunPlan._ramp_seconds(3, 0.5, 1), 1.5)
+
+    def test_diff(self):
+        plan = DryRunPlan()
+        plan.record(LOGIN, 100)
+        before = plan.snapshot()
+        plan.record(CREATE_TASK, 300, targets=5)
+        plan.record(LOGIN, 100)
+        self.assertEqual(DryRunPlan.diff(plan.snapshot(), before), {
+            CREATE_TASK: {"count": 1, "request_bytes": 300, "targets": 5},
+            LOGIN: {"count": 1, "request_bytes": 100, "targets": 0},
+        })
+
+    def test_estimate_uses_measured_latency_and_default(self):
+        stats = RpcStats()
+        stats.record(GET_COMPUTER, 0.5, 100, 2000)
+        calls = {
+            GET_COMPUTER: {"count": 10, "request_bytes": 1000, "targets": 0},
+            CREATE_TASK: {"count": 2, "request_bytes": 600, "targets": 10},
+        }
+        result = DryRunPlan.estimate(calls, stats, max_concurrency=4)
+
+        self.assertEqual(result["parallel_seconds"], 4 * 0.5)
+        self.assertEqual(result["serial_seconds"], 2 * em.DEFAULT_LATENCY_ESTIMATE)
+        self.assertEqual(result["worst_case_seconds"], 10 * 0.5 + 2 * em.DEFAULT_LATENCY_ESTIMATE)
+        self.assertEqual(result["request_bytes"], 1600)
+        self.assertEqual(result["response_bytes"], 20000)
+        rows = {row["method"]: row for row in result["rows"]}
+        self.assertIsNone(rows[CREATE_TASK]["response_bytes"])
+        self.assertEqual(result["unmeasured"], [CREATE_TASK])
+
+    def test_total_is_marked_as_lower_bound_when_unmeasured(self):
+        stats = RpcStats()
+        stats.record(LOGIN, 0.1, 100, 2048)
+        plan = DryRunPlan()
+        plan.record(LOGIN, 100)
+        plan.record(CREATE_TASK, 300, targets=2)
+
+        with self.assertLogs("DryRunPlan", level="INFO") as logs:
+            plan.log_report(stats, 4, plan.snapshot(), [])
+        total = next(line for line in logs.output if "[PLAN] Total:" in line)
+        self.assertIn("response >= 2.0 KiB (not measured: RpcCreateClientTaskRequest)", total)
+
+    def test_total_is_an_estimate_when_everything_is_measured(self):
+        stats = RpcStats()
+        stats.record(LOGIN, 0.1, 100, 2048)
+        plan = DryRunPlan()
+        plan.record(LOGIN, 100)
+
+        with self.assertLogs("DryRunPlan", level="INFO") as logs:
+            plan.log_report(stats, 4, plan.snapshot(), [])
+        total = next(line for line in logs.output if "[PLAN] Total:" in line)
+        self.assertIn("response ~2.0 KiB", total)
+        self.assertNotIn("not measured", total)
+
+
+class TestRpcStats(unittest.TestCase):
+    def test_load_drops_malformed_data(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "rpc_stats.json"
+            good = {"count": 3, "latency": 0.2, "request_bytes": 10, "response_bytes": 20}
+
+            for content, expected in (
+                ([], {}),
+                ({"a": {"count": 1}, "b": good, "c": "x"}, {"b": good}),
+            ):
+                path.write_text(json.dumps(content), encoding="utf-8")
+                stats = RpcStats(path)
+                stats.load()
+                self.assertEqual(stats.methods, expected)
+                stats.record("a", 0.1, 1, 1)  # must not raise
+
+    def test_save_roundtrip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "rpc_stats.json"
+            stats = RpcStats(path)
+            stats.record(LOGIN, 0.1, 10, 20)
+            stats.save()
+
+            loaded = RpcStats(path)
+            loaded.load()
+            self.assertEqual(loaded.get(LOGIN)["count"], 1)
+            self.assertEqual([p.name for p in Path(tmp).iterdir()], ["rpc_stats.json"])
+
+
+class TestDryRunOutputs(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self._tmp.name)
+        self.csv = _write_csv(self.dir / "pcs.csv", ["PC1", "PC2"])
+        self.client = StubClient(computers=[{"name": "PC1", "uuid": "1"}, {"name": "PC2", "uuid": "2"}], dry_run=True)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_info_writes_nothing(self):
+        output = self.dir / "info.csv"
+        with self.assertLogs("ESETManager", level="INFO") as logs:
+            ESETManager(self.client).run_info(self.csv, output)
+        self.assertFalse(output.exists())
+        self.assertTrue(any(f"[DRY-RUN] Would write 2 rows to {output}" in line for line in logs.output))
+
+    def test_info_streaming_branch_writes_nothing(self):
+        output = self.dir / "info.csv"
+        summary = ESETManager(self.client, memory_budget=FixedBudget(1)).run_info(self.csv, output)
+        self.assertFalse(output.exists())
+        self.assertEqual(summary["total"], 2)
+
+    def test_task_writes_nothing(self):
+        output = self.dir / "task.csv"
+        with self.assertLogs("ESETManager", level="INFO") as logs:
+            ESETManager(self.client).run_task(self.csv, "Update", output_file=output)
+        self.assertFalse(output.exists())
+        self.assertTrue(any(f"[DRY-RUN] Would write 1 rows to {output}" in line for line in logs.output))
+
+
+class TestInventoryCache(unittest.TestCase):
+    COMPUTERS = [{"name": "PC1", "uuid": "1"}]
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _client(self, dry_run=False):
+        client = ESETAPIClient(CLIENT_CONFIG, dry_run=dry_run)
+        client.get_computers = lambda parent_group_uuid=None: list(self.COMPUTERS)
+        return client
+
+    def test_real_export_writes_cache_atomically(self):
+        cache = self.dir / "inventory.json"
+        self._client().load_inventory(cache_file=cache)
+        self.assertEqual(json.loads(cache.read_text(encoding="utf-8")), self.COMPUTERS)
+        self.assertEqual([p.name for p in self.dir.iterdir()], ["inventory.json"])
+
+    def test_failed_cache_write_does_not_abort(self):
+        cache = self.dir / "missing" / "inventory.json"
+        client = self._client()
+        with self.assertLogs("ESETAPIClient", level="WARNING"):
+            inventory = client.load_inventory(cache_file=cache)
+        self.assertEqual(inventory, self.COMPUTERS)
+        self.assertEqual(client.get_computer_by_name("pc1")["uuid"], "1")
+
+    def test_dry_run_reads_cache_and_plans_export(self):
+        cache = self.dir / "inventory.json"
+        cache.write_text(json.dumps([{"name": "CACHED", "uuid": "9"}]), encoding="utf-8")
+        client = self._client(dry_run=True)
+        client.load_inventory(cache_file=cache)
+        self.assertEqual(client.get_computer_by_name("cached")["uuid"], "9")
+        self.assertEqual(client.plan.snapshot()[EXPORT]["count"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()